@@ -50,7 +50,7 @@ def generate(difficulty: Difficulty, output: str) -> None:
     if output == GenerationOutput.STDOUT:
         sudoku.print_puzzle(title=f"{difficulty.name.capitalize()} difficulty")
     elif output == GenerationOutput.FILE:
-        sudoku_saver.save_puzzle_as_image()
+        sudoku_saver.save_puzzle_as_txt()
     elif output == GenerationOutput.IMAGE:
         sudoku_saver.save_puzzle_as_image()
     else:
@@ -0,0 +1,150 @@
+import numpy as np
+from numba import njit
+
+from ..types.sudoku_types import Grid
+from .geometry import BOX_OF, COL_OF, ROW_OF
+
+# Array copies of the geometry tables, which compiled code can index directly
+_ROW_OF = np.array(ROW_OF)
+_COL_OF = np.array(COL_OF)
+_BOX_OF = np.array(BOX_OF)
+
+# Digits are tracked as bits 1..9, so this is the "any digit" mask.
+_ALL_DIGITS_MASK = 0x3FE
+
+
+@njit(cache=True)
+def _popcount(mask: int) -> int:
+    """
+    Count the set bits of a candidate mask.
+
+    LLVM recognises this loop and compiles it to a single POPCNT instruction,
+    so there is nothing to gain from lookup tables or packing several masks
+    into one word.
+
+    Args:
+        mask (int): The mask to count.
+
+    Returns:
+        int: The number of set bits.
+    """
+    count = 0
+    while mask:
+        mask &= mask - 1
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def solve_bitmask(
+    grid: np.ndarray, row: np.ndarray, col: np.ndarray, box: np.ndarray
+) -> bool:
+    """
+    Fill the empty cells of a flat grid in place using MRV backtracking.
+
+    The recursion is unrolled into an explicit stack holding, per level, the
+    cell being filled and the candidates that are still left to try.
+
+    Args:
+        grid (np.ndarray): The 81 cells as uint8, 0 marks an empty cell.
+        row (np.ndarray): The uint16 digit bitmask of each row.
+        col (np.ndarray): The uint16 digit bitmask of each column.
+        box (np.ndarray): The uint16 digit bitmask of each 3x3 box.
+
+    Returns:
+        bool: True if the grid is filled successfully, False otherwise.
+    """
+    stack_cell = np.empty(81, dtype=np.int64)
+    stack_mask = np.empty(81, dtype=np.int64)
+    depth = 0
+
+    while True:
+        # Pick the empty cell with the fewest candidates
+        best_count = 10
+        best_cell = -1
+        best_mask = 0
+        dead_end = False
+        for cell in range(81):
+            if grid[cell] != 0:
+                continue
+
+            mask = (
+                ~(row[_ROW_OF[cell]] | col[_COL_OF[cell]] | box[_BOX_OF[cell]])
+                & _ALL_DIGITS_MASK
+            )
+            count = _popcount(mask)
+            if count == 0:
+                dead_end = True
+                break
+            if count < best_count:
+                best_count, best_cell, best_mask = count, cell, mask
+                if count == 1:
+                    break
+
+        if not dead_end:
+            if best_cell == -1:
+                return True  # The grid is filled successfully
+
+            stack_cell[depth] = best_cell
+            stack_mask[depth] = best_mask
+            depth += 1
+
+        # Undo the last placement and move on to its next candidate,
+        # unwinding every level whose candidates are exhausted
+        while True:
+            if depth == 0:
+                return False
+
+            cell = stack_cell[depth - 1]
+            r, c, b = _ROW_OF[cell], _COL_OF[cell], _BOX_OF[cell]
+            if grid[cell] != 0:
+                bit = 1 << grid[cell]
+                row[r] ^= bit
+                col[c] ^= bit
+                box[b] ^= bit
+                grid[cell] = 0
+
+            mask = stack_mask[depth - 1]
+            if mask == 0:
+                depth -= 1
+                continue
+
+            num = 1
+            while not (mask >> num) & 1:
+                num += 1
+            bit = 1 << num
+            stack_mask[depth - 1] = mask ^ bit
+            grid[cell] = num
+            row[r] ^= bit
+            col[c] ^= bit
+            box[b] ^= bit
+            break
+
+
+def solve_grid(
+    grid: Grid, row_mask: list[int], col_mask: list[int], box_mask: list[int]
+) -> bool:
+    """
+    Solve a flat grid with the compiled solver, updating it and its masks in place.
+
+    Args:
+        grid (Grid): The grid to solve.
+        row_mask (list[int]): The digit bitmask of each row.
+        col_mask (list[int]): The digit bitmask of each column.
+        box_mask (list[int]): The digit bitmask of each 3x3 box.
+
+    Returns:
+        bool: True if the grid is filled successfully, False otherwise.
+    """
+    # The bytearray is writable, so the compiled code can fill it without a copy
+    cells = np.frombuffer(grid, dtype=np.uint8)
+    row = np.array(row_mask, dtype=np.uint16)
+    col = np.array(col_mask, dtype=np.uint16)
+    box = np.array(box_mask, dtype=np.uint16)
+
+    solved: bool = solve_bitmask(cells, row, col, box)
+
+    row_mask[:] = row.tolist()
+    col_mask[:] = col.tolist()
+    box_mask[:] = box.tolist()
+    return solved
@@ -0,0 +1,35 @@
+# Every cell of the grid, as flat indices (row * 9 + col).
+ALL_CELLS: tuple[int, ...] = tuple(range(81))
+
+# Row, column and 3x3 box of each cell, keyed by flat index.
+ROW_OF: tuple[int, ...] = tuple(cell // 9 for cell in ALL_CELLS)
+COL_OF: tuple[int, ...] = tuple(cell % 9 for cell in ALL_CELLS)
+BOX_OF: tuple[int, ...] = tuple(
+    (ROW_OF[cell] // 3) * 3 + COL_OF[cell] // 3 for cell in ALL_CELLS
+)
+
+# The 9 cells of each row, column and 3x3 box, keyed by its index.
+ROW_CELLS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(cell for cell in ALL_CELLS if ROW_OF[cell] == row) for row in range(9)
+)
+COL_CELLS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(cell for cell in ALL_CELLS if COL_OF[cell] == col) for col in range(9)
+)
+BOX_CELLS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(cell for cell in ALL_CELLS if BOX_OF[cell] == box) for box in range(9)
+)
+
+# The 20 other cells sharing a row, column or box with each cell.
+PEERS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        sorted(
+            (
+                set(ROW_CELLS[ROW_OF[cell]])
+                | set(COL_CELLS[COL_OF[cell]])
+                | set(BOX_CELLS[BOX_OF[cell]])
+            )
+            - {cell}
+        )
+    )
+    for cell in ALL_CELLS
+)
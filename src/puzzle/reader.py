@@ -3,6 +3,11 @@ from pathlib import Path
 from ..puzzle.sudoku import Sudoku
 from ..types.sudoku_types import Grid
 
+# Maps the ASCII digits to their value and every other byte to 0 (a blank cell)
+_CELL_TABLE: bytes = bytes(
+    byte - ord("0") if ord("0") <= byte <= ord("9") else 0 for byte in range(256)
+)
+
 
 class SudokuReader:
     @staticmethod
@@ -40,24 +45,26 @@ class SudokuReader:
     @staticmethod
     def _read_txt_file(file_path: Path) -> Grid:
         """
-        Read a text file and convert its contents into a 2D grid.
+        Read a text file and convert its contents into a flat grid.
 
         Args:
             file_path (Path): The path to the text file.
 
         Returns:
-            Grid: A 2D grid representing the contents of the text file.
+            Grid: A flat grid with the cells of the text file in row-major order.
         """
-        puzzle: Grid = []
-        with open(file_path, "r") as f:
-            for line in f:
-                values: list[str] = line.replace(",", " ").replace("\n", "").split()
-                row: list[int] = [
-                    int(cell) if cell.isnumeric() else 0 for cell in values
-                ]
-                puzzle.append(row)
+        values: list[str] = file_path.read_text().replace(",", " ").split()
+
+        # When every cell is a single ASCII character the whole grid can be
+        # decoded with one table lookup instead of converting cell by cell
+        cells: bytes = "".join(values).encode()
+        if len(cells) == len(values):
+            return bytearray(cells.translate(_CELL_TABLE))
 
-        return puzzle
+        # Numbers too large for a byte are clamped, _is_valid_puzzle rejects them
+        return bytearray(
+            min(int(cell), 0xFF) if cell.isnumeric() else 0 for cell in values
+        )
 
     @staticmethod
     def _is_valid_puzzle(puzzle: Grid) -> bool:
@@ -70,15 +77,5 @@ class SudokuReader:
         Returns:
             bool: True if the puzzle is valid, False otherwise.
         """
-        if len(puzzle) != 9:
-            return False
-
-        for row in puzzle:
-            if len(row) != 9:
-                return False
-
-            for num in row:
-                if not (0 <= int(num) <= 9):
-                    return False
-
-        return True
+        # Cells are unsigned bytes, so only the upper bound needs checking
+        return len(puzzle) == 81 and max(puzzle) <= 9
@@ -1,10 +1,39 @@
+import os
 from pathlib import Path
+from typing import Optional, Union
 
 from PIL import Image, ImageDraw, ImageFont
 from PIL.ImageFont import FreeTypeFont
 
+from .geometry import COL_OF, ROW_OF
 from .sudoku import Sudoku
 
+DEFAULT_FONT_PATH: str = "/usr/share/fonts/TTF/CascadiaCode.ttf"
+
+Font = Union[FreeTypeFont, ImageFont.ImageFont]
+
+_font: Optional[Font] = None
+
+
+def _get_font() -> Font:
+    """
+    Load the font used to draw the digits, reusing it across saves.
+
+    The font file can be overridden with the SUDOKU_FONT environment variable.
+    If it cannot be opened, Pillow's built-in font is used instead.
+
+    Returns:
+        Font: The loaded font.
+    """
+    global _font
+    if _font is None:
+        font_path: str = os.environ.get("SUDOKU_FONT", DEFAULT_FONT_PATH)
+        try:
+            _font = ImageFont.truetype(font=font_path, size=70)
+        except OSError:
+            _font = ImageFont.load_default(size=70)
+    return _font
+
 
 class SudokuSaver:
     def __init__(self, sudoku: Sudoku) -> None:
@@ -30,13 +59,14 @@ class SudokuSaver:
             None: This function does not return anything.
         """
         file_path = Path(filename)
-        with open(file_path, "w") as f:
-            for row in range(9):
-                for col in range(8):
-                    value: int = self.sudoku.grid[row][col]
-                    f.write(f"{value if value != 0 else '_'} ")
-                last_value: int = self.sudoku.grid[row][8]
-                f.write(f"{last_value if last_value != 0 else '_'}\n")
+        grid = self.sudoku.grid
+        rows: list[str] = [
+            " ".join(
+                f"{value if value != 0 else '_'}" for value in grid[start : start + 9]
+            )
+            for start in range(0, 81, 9)
+        ]
+        file_path.write_text("\n".join(rows) + "\n")
         print(f"Saved puzzle to {file_path}")
 
     def save_puzzle_as_image(self, filename: str = "sudoku.png") -> None:
@@ -52,38 +82,38 @@ class SudokuSaver:
         # Define some constants for image creation
         cell_size: int = 100
         grid_size: int = cell_size * 9 + 20
+        grid_end: int = cell_size * 9
         box_border_width: int = 5  # Width of the box boundaries
         image: Image.Image = Image.new("RGB", (grid_size, grid_size), "white")
         draw: ImageDraw.ImageDraw = ImageDraw.Draw(image)
-        font: FreeTypeFont = ImageFont.truetype(
-            font="/usr/share/fonts/TTF/CascadiaCode.ttf", size=70
-        )
-
-        # Draw the Sudoku grid
-        for row in range(9):
-            for col in range(9):
-                cell_value: int = self.sudoku.grid[row][col]
-                x1: float = col * cell_size
-                y1: float = row * cell_size
-                x2: float = x1 + cell_size
-                y2: float = y1 + cell_size
-
-                # Draw a rectangle for each cell
-                draw.rectangle((x1, y1, x2, y2), outline="gray")
-
-                # Draw the 3x3 box boundaries (thicker lines)
-                if row % 3 == 0:
-                    draw.line(
-                        [(x1, y1), (x2, y1)], fill="black", width=box_border_width
-                    )
-                if col % 3 == 0:
-                    draw.line(
-                        [(x1, y1), (x1, y2)], fill="black", width=box_border_width
-                    )
 
+        # Draw the thin cell lines first so the box boundaries stay on top
+        for k in range(10):
+            if k % 3 != 0:
+                offset: int = k * cell_size
+                draw.line([(0, offset), (grid_end, offset)], fill="gray")
+                draw.line([(offset, 0), (offset, grid_end)], fill="gray")
+
+        # Draw the 3x3 box boundaries (thicker lines)
+        for k in range(0, 10, 3):
+            offset = k * cell_size
+            draw.line(
+                [(0, offset), (grid_end, offset)], fill="black", width=box_border_width
+            )
+            draw.line(
+                [(offset, 0), (offset, grid_end)], fill="black", width=box_border_width
+            )
+
+        # Draw the digits, the font is only needed if there is one to draw
+        if any(self.sudoku.grid):
+            font: Font = _get_font()
+            for cell, cell_value in enumerate(self.sudoku.grid):
                 if cell_value != 0:
                     draw.text(  # type: ignore
-                        xy=(x1 + 30, y1 + 10),
+                        xy=(
+                            COL_OF[cell] * cell_size + 30,
+                            ROW_OF[cell] * cell_size + 10,
+                        ),
                         text=str(cell_value),
                         fill="black",
                         font=font,
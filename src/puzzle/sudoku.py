@@ -1,9 +1,68 @@
 import random
-from typing import Optional
-
-from prettytable import PrettyTable
+from collections import deque
+from typing import Callable, Iterable, Optional
 
 from ..types.sudoku_types import Difficulty, Grid
+from .geometry import ALL_CELLS, BOX_OF, COL_OF, PEERS, ROW_OF
+
+# Digits are tracked as bits 1..9 of an int, so this is the "any digit" mask.
+ALL_DIGITS_MASK: int = 0x3FE
+
+# A valid solved grid that _fill_random shuffles into new random solutions.
+_BASE_SOLVED: bytes = bytes(
+    (3 * (ROW_OF[cell] % 3) + ROW_OF[cell] // 3 + COL_OF[cell]) % 9 + 1
+    for cell in ALL_CELLS
+)
+
+# Printed form of each cell value, a blank for 0.
+_CELL_TEXT: tuple[str, ...] = (" ", "1", "2", "3", "4", "5", "6", "7", "8", "9")
+
+# Fixed 9x9 layout for print_puzzle, one "{}" placeholder per cell.
+_BAND_TEMPLATE: str = "\n".join(["│ {} {} {} │ {} {} {} │ {} {} {} │"] * 3)
+_GRID_BODY_TEMPLATE: str = "\n".join(
+    [
+        _BAND_TEMPLATE,
+        "├───────┼───────┼───────┤",
+        _BAND_TEMPLATE,
+        "├───────┼───────┼───────┤",
+        _BAND_TEMPLATE,
+        "└───────┴───────┴───────┘",
+    ]
+)
+_GRID_TEMPLATE: str = "┌───────┬───────┬───────┐\n" + _GRID_BODY_TEMPLATE
+_TITLED_GRID_TEMPLATE: str = (
+    "┌───────────────────────┐\n"
+    "│{title:^23.23}│\n"
+    "├───────┬───────┬───────┤\n" + _GRID_BODY_TEMPLATE
+)
+
+# Signature of the compiled solver in _solver_nb, which needs numba.
+_SolveGrid = Callable[[Grid, list[int], list[int], list[int]], bool]
+
+_solve_grid: Optional[_SolveGrid] = None
+_solve_grid_loaded: bool = False
+
+
+def _get_compiled_solver() -> Optional[_SolveGrid]:
+    """
+    Import the Numba-compiled solver on first use, reusing it across solves.
+
+    Importing numba is slow, so it is only done once a puzzle is actually
+    solved rather than whenever this module is loaded.
+
+    Returns:
+        Optional[_SolveGrid]: The compiled solver, or None if numba is not installed.
+    """
+    global _solve_grid, _solve_grid_loaded
+    if not _solve_grid_loaded:
+        try:
+            from ._solver_nb import solve_grid
+
+            _solve_grid = solve_grid
+        except ImportError:  # numba is optional, fall back to the pure Python solver
+            _solve_grid = None
+        _solve_grid_loaded = True
+    return _solve_grid
 
 
 class Sudoku:
@@ -11,12 +70,16 @@ class Sudoku:
         """
         Initializes a new Sudoku grid with empty cells.
 
-        The grid is represented as a 9x9 matrix, where each cell is initially set to 0.
+        The grid is stored as a flat bytearray of 81 cells in row-major order, so the
+        cell at (row, col) lives at index row * 9 + col. Every cell starts as 0.
 
         Returns:
             None
         """
-        self.grid: Grid = [[0 for _ in range(9)] for _ in range(9)]
+        self.grid: Grid = bytearray(81)
+        self.row_mask: list[int] = [0] * 9
+        self.col_mask: list[int] = [0] * 9
+        self.box_mask: list[int] = [0] * 9
 
     def generate_puzzle(self, difficulty: Difficulty = Difficulty.MEDIUM) -> Grid:
         """
@@ -25,68 +88,35 @@ class Sudoku:
         Returns:
             Grid: The generated Sudoku puzzle.
         """
-        self.set_puzzle()
+        self._fill_random()
         self._remove_numbers(difficulty)
         return self.grid
 
     def solve(self) -> bool:
         """
-        Solves the Sudoku puzzle recursively using backtracking.
+        Solves the Sudoku puzzle using backtracking.
 
         Returns:
             bool: True if the grid is filled successfully, False otherwise.
         """
-        empty_cells: list[tuple[int, int]] = [
-            (row, col)
-            for row in range(9)
-            for col in range(9)
-            if self.grid[row][col] == 0
-        ]
-
-        if not empty_cells:
-            return True  # The grid is filled successfully
-
-        # Sort empty cells by the number of candidates
-        empty_cells.sort(key=lambda cell: len(self._get_candidates(cell[0], cell[1])))
-
-        row, col = empty_cells[0]
-        candidates: list[int] = self._get_candidates(row, col)
+        solve_grid: Optional[_SolveGrid] = _get_compiled_solver()
+        if solve_grid is not None:
+            return solve_grid(self.grid, self.row_mask, self.col_mask, self.box_mask)
 
-        for num in candidates:
-            self.grid[row][col] = num
-            if self.solve():
-                return True
-            self.grid[row][col] = 0
-
-        return False
+        return self._solve_mrv()
 
-    def set_puzzle(self, grid: Optional[Grid] = None) -> bool:
+    def set_puzzle(self, grid: Grid) -> None:
         """
         Sets the puzzle grid for the Sudoku object.
 
         Parameters:
-            grid (Optional[Grid]): The grid representing the Sudoku puzzle. If not provided, a new empty grid will be used.
+            grid (Grid): The grid representing the Sudoku puzzle.
 
-        Returns:
-            bool: True if the puzzle grid was successfully set, False otherwise.
-        """
-        if grid:
-            self.grid = grid
-            return True
-
-        for row in range(9):
-            for col in range(9):
-                if self.grid[row][col] == 0:
-                    candidates = list(range(1, 10))
-                    random.shuffle(candidates)
-                    for num in candidates:
-                        if self._can_place(row, col, num):
-                            self.grid[row][col] = num
-                            if self.set_puzzle():
-                                return True
-                            self.grid[row][col] = 0
-                    return False
-        return True
+        Raises:
+            ValueError: If the grid repeats a digit within a row, column or box.
+        """
+        self.grid = grid
+        self._sync_masks()
 
     def print_puzzle(self, title: Optional[str] = "Sudoku Puzzle") -> None:
         """
@@ -98,129 +128,281 @@ class Sudoku:
         Returns:
             None
         """
-        table: PrettyTable = PrettyTable()
+        cells: list[str] = [_CELL_TEXT[num] for num in self.grid]
 
-        table.title = title
-        table.header = False
-        for _, row in enumerate(self.grid):
-            pretty_row: list[str] = [f"{num}" if num != 0 else " " for num in row]
-            table.add_row(row=pretty_row, divider=True)  # type: ignore
+        if title:
+            print(_TITLED_GRID_TEMPLATE.format(*cells, title=title))
+        else:
+            print(_GRID_TEMPLATE.format(*cells))
 
-        print(table)
+    def _fill_random(self) -> None:
+        """
+        Fill the whole grid with a random, fully solved Sudoku.
 
-    def _remove_numbers(self, difficulty: Difficulty) -> Grid:
+        Instead of searching, a known solution is reshuffled with moves that keep
+        it valid: relabelling the digits, reordering the bands and stacks,
+        reordering the rows within each band and the columns within each stack,
+        and transposing.
+
+        Returns:
+            None
         """
-        Removes a specified number of cells from the grid based on the given difficulty.
+        rows: list[int] = [
+            band * 3 + row
+            for band in random.sample(range(3), 3)
+            for row in random.sample(range(3), 3)
+        ]
+        cols: list[int] = [
+            stack * 3 + col
+            for stack in random.sample(range(3), 3)
+            for col in random.sample(range(3), 3)
+        ]
+        positions = zip(ROW_OF, COL_OF)
+        if random.random() < 0.5:
+            positions = zip(COL_OF, ROW_OF)  # Transpose
+        grid: Grid = bytearray(
+            _BASE_SOLVED[rows[r] * 9 + cols[c]] for r, c in positions
+        )
+
+        # Relabel the digits, only the first 10 entries of the table are ever used
+        digits: bytes = bytes([0, *random.sample(range(1, 10), 9)])
+        self.grid = grid.translate(digits.ljust(256, b"\0"))
+        self._sync_masks()
+
+    def _solve_mrv(self, empty_cells: Optional[tuple[int, ...]] = None) -> bool:
+        """
+        Fill the empty cells recursively, always branching on the cell with the
+        fewest candidates (minimum remaining values).
 
         Parameters:
-            difficulty (Difficulty): The difficulty level of the Sudoku puzzle.
+            empty_cells (Optional[tuple[int, ...]]): The cells that were empty when
+                solving started. Computed from the grid if not provided.
 
         Returns:
-            Grid: The modified grid with cells removed.
+            bool: True if the grid is filled successfully, False otherwise.
         """
-        # Get all cell positions in the grid
-        cell_positions: list[tuple[int, int]] = [
-            (row, col) for row in range(9) for col in range(9)
-        ]
+        # Cells filled before solving started never need to be looked at again
+        if empty_cells is None:
+            empty_cells = tuple(cell for cell in ALL_CELLS if self.grid[cell] == 0)
+
+            # Fill in everything the givens already force before searching
+            forced: list[int] = []
+            if self._propagate_singles(empty_cells, forced) and self._solve_mrv(
+                empty_cells
+            ):
+                return True
 
-        # Calculate the number of cells to remove based on difficulty
-        lower_bound = int(difficulty.value.low_percentage * 81)  # 85% of 81
-        upper_bound = int(difficulty.value.high_percentage * 81)  # 95% of 81
-        num_cells_to_remove: int = random.randint(lower_bound, upper_bound)
+            self._unplace_all(forced)
+            return False
 
-        # Shuffle the list of cell positions
-        random.shuffle(cell_positions)
+        # Pick the empty cell with the fewest candidates in a single pass
+        best_count: int = 10
+        best_cell: int = -1
+        best_mask: int = 0
+        for cell in empty_cells:
+            if self.grid[cell] != 0:
+                continue
+
+            # Same as self._get_candidates(cell), inlined on the hottest loop
+            mask: int = (
+                ~(
+                    self.row_mask[ROW_OF[cell]]
+                    | self.col_mask[COL_OF[cell]]
+                    | self.box_mask[BOX_OF[cell]]
+                )
+                & ALL_DIGITS_MASK
+            )
+            count: int = mask.bit_count()
+            if count == 0:
+                return False  # Dead end, some cell has no candidates left
+            if count < best_count:
+                best_count, best_cell, best_mask = count, cell, mask
+                if count == 1:
+                    break  # A naked single cannot be beaten
+
+        if best_cell == -1:
+            return True  # The grid is filled successfully
 
-        for i in range(num_cells_to_remove):
-            row, col = cell_positions[i]
-            self.grid[row][col] = 0
+        candidates: list[int] = []
+        while best_mask:
+            bit: int = best_mask & -best_mask
+            best_mask ^= bit
+            candidates.append(bit.bit_length() - 1)
 
-        return self.grid
+        for num in candidates:
+            self._place(best_cell, num)
+
+            # Fill in every cell this placement forces before branching again
+            forced = []
+            if self._propagate_singles(PEERS[best_cell], forced) and self._solve_mrv(
+                empty_cells
+            ):
+                return True
+
+            self._unplace_all(forced)
+            self._unplace(best_cell)
 
-    def _can_place(self, row: int, col: int, num: int) -> bool:
+        return False
+
+    def _propagate_singles(self, cells: Iterable[int], forced: list[int]) -> bool:
         """
-        Check if a number can be placed in a specific position on the Sudoku board.
+        Place every naked single reachable from the given cells.
+
+        The given cells are checked first, then the peers of each newly filled
+        cell, until no cell with a single candidate remains. Cells filled this
+        way are appended to forced so that the caller can clear them again when
+        backtracking.
 
         Parameters:
-            row (int): The row index of the position.
-            col (int): The column index of the position.
-            num (int): The number to be placed.
+            cells (Iterable[int]): The flat indices of the cells to check first.
+            forced (list[int]): Receives the flat indices of the cells filled here.
 
         Returns:
-            bool: True if the number can be placed, False otherwise.
+            bool: False if some empty cell was left without candidates, True otherwise.
         """
-        # Check the row
-        if num in self._get_row_values(row):
-            return False
+        pending: deque[int] = deque(cells)
+        while pending:
+            peer: int = pending.popleft()
+            if self.grid[peer] != 0:
+                continue
+
+            mask: int = self._get_candidates(peer)
+            if mask == 0:
+                return False
+            if mask & (mask - 1) == 0:
+                self._place(peer, mask.bit_length() - 1)
+                forced.append(peer)
+                pending.extend(PEERS[peer])
 
-        # Check the column
-        if num in self._get_col_values(col):
-            return False
+        return True
 
-        # Check the 3x3 box
-        if num in self._get_block_values(row, col):
-            return False
+    def _place(self, cell: int, num: int) -> None:
+        """
+        Write a number into an empty cell and mark it as used in the masks.
 
-        return True
+        Parameters:
+            cell (int): The flat index of the cell.
+            num (int): The number to place.
+
+        Returns:
+            None
+        """
+        bit: int = 1 << num
+        self.grid[cell] = num
+        self.row_mask[ROW_OF[cell]] ^= bit
+        self.col_mask[COL_OF[cell]] ^= bit
+        self.box_mask[BOX_OF[cell]] ^= bit
 
-    def _get_candidates(self, row_values: int, col_values: int) -> list[int]:
+    def _unplace(self, cell: int) -> None:
         """
-        Recursively fills the Sudoku grid with valid numbers.
+        Empty a filled cell and release its number from the masks.
 
         Parameters:
-            row_values (int): The row index of the current cell.
-            col_values (int): The column index of the current cell.
+            cell (int): The flat index of the cell.
 
         Returns:
-            list[int]: A list of valid numbers that can be placed in the current cell.
+            None
         """
-        candidates = set(range(1, 10))
-        candidates -= self._get_row_values(row_values)
-        candidates -= self._get_col_values(col_values)
-        candidates -= self._get_block_values(row_values, col_values)
-        return list(candidates)
+        bit: int = 1 << self.grid[cell]
+        self.grid[cell] = 0
+        self.row_mask[ROW_OF[cell]] ^= bit
+        self.col_mask[COL_OF[cell]] ^= bit
+        self.box_mask[BOX_OF[cell]] ^= bit
 
-    def _get_row_values(self, row: int) -> set[int]:
+    def _unplace_all(self, cells: list[int]) -> None:
         """
-        Get the values in a specific row of the grid.
+        Empty the given cells in the reverse order they were filled.
 
         Parameters:
-            row (int): The index of the row to retrieve the values from.
+            cells (list[int]): The flat indices of the cells to clear.
 
         Returns:
-            set[int]: A set containing the values in the specified row.
+            None
         """
-        return set(self.grid[row])
+        for cell in reversed(cells):
+            self._unplace(cell)
 
-    def _get_col_values(self, col: int) -> set[int]:
+    def _remove_numbers(self, difficulty: Difficulty) -> Grid:
         """
-        Get the values in a specific column of the grid.
+        Removes a specified number of cells from the grid based on the given difficulty.
 
         Parameters:
-            col (int): The index of the column.
+            difficulty (Difficulty): The difficulty level of the Sudoku puzzle.
 
         Returns:
-            set[int]: A set containing the values in the column.
+            Grid: The modified grid with cells removed.
         """
+        # Calculate the number of cells to remove based on difficulty
+        num_cells_to_remove: int = random.randint(
+            difficulty.value.low_count, difficulty.value.high_count
+        )
+
+        # Draw only as many distinct cells as need to be cleared
+        for cell in random.sample(ALL_CELLS, num_cells_to_remove):
+            self.grid[cell] = 0
 
-        return set(self.grid[row][col] for row in range(9))
+        self._sync_masks()
+        return self.grid
 
-    def _get_block_values(self, row: int, col: int) -> set[int]:
+    def _sync_masks(self) -> None:
         """
-        Get the values in the 3x3 block containing the given cell.
+        Rebuild the row, column and box bitmasks from the current grid.
 
-        Args:
-            row (int): The row index of the cell.
-            col (int): The column index of the cell.
+        Raises:
+            ValueError: If the grid repeats a digit within a row, column or box.
+        """
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.box_mask = [0] * 9
+
+        for cell, num in enumerate(self.grid):
+            if num == 0:
+                continue
+            if not self._can_place(cell, num):
+                raise ValueError("Invalid puzzle.")
+
+            self._place(cell, num)
+
+    def _can_place(self, cell: int, num: int) -> bool:
+        """
+        Check if a number can be placed in a specific position on the Sudoku board.
+
+        Parameters:
+            cell (int): The flat index of the position.
+            num (int): The number to be placed.
 
         Returns:
-            set[int]: A set of values in the specified 3x3 block.
+            bool: True if the number can be placed, False otherwise.
+        """
+        bit: int = 1 << num
+
+        # Check the row
+        if self.row_mask[ROW_OF[cell]] & bit:
+            return False
+
+        # Check the column
+        if self.col_mask[COL_OF[cell]] & bit:
+            return False
+
+        # Check the 3x3 box
+        if self.box_mask[BOX_OF[cell]] & bit:
+            return False
+
+        return True
+
+    def _get_candidates(self, cell: int) -> int:
         """
-        start_row, start_col = (row // 3) * 3, (col // 3) * 3
-        block_values: set[int] = set()
+        Get the numbers that can still be placed in a cell.
 
-        for i in range(3):
-            for j in range(3):
-                block_values.add(self.grid[start_row + i][start_col + j])
+        Parameters:
+            cell (int): The flat index of the cell.
 
-        return block_values
+        Returns:
+            int: A bitmask with bit n set for every number n that can be placed.
+        """
+        used: int = (
+            self.row_mask[ROW_OF[cell]]
+            | self.col_mask[COL_OF[cell]]
+            | self.box_mask[BOX_OF[cell]]
+        )
+        return ~used & ALL_DIGITS_MASK
@@ -1,12 +1,21 @@
+from dataclasses import dataclass, field
 from enum import Enum, StrEnum
-from typing import NamedTuple
 
-Grid = list[list[int]]
+# 81 cells in row-major order, 0 marks an empty cell
+Grid = bytearray
 
 
-class DifficultyRange(NamedTuple):
+@dataclass(frozen=True)
+class DifficultyRange:
     low_percentage: float
     high_percentage: float
+    # Bounds on the number of cells to clear, derived once from the percentages
+    low_count: int = field(init=False)
+    high_count: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "low_count", int(self.low_percentage * 81))
+        object.__setattr__(self, "high_count", int(self.high_percentage * 81))
 
 
 class Difficulty(Enum):
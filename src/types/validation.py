@@ -4,10 +4,15 @@ import click
 
 from ..types.sudoku_types import Difficulty, GenerationOutput
 
-difficulty_choices: list[str] = [difficulty.name.lower() for difficulty in Difficulty]
-generation_output_choices: list[str] = [
-    generation_output.name.lower() for generation_output in GenerationOutput
-]
+_DIFFICULTY_BY_NAME: dict[str, Difficulty] = {
+    difficulty.name.lower(): difficulty for difficulty in Difficulty
+}
+_GENERATION_OUTPUT_BY_NAME: dict[str, GenerationOutput] = {
+    generation_output.name.lower(): generation_output
+    for generation_output in GenerationOutput
+}
+difficulty_choices: tuple[str, ...] = tuple(_DIFFICULTY_BY_NAME)
+generation_output_choices: tuple[str, ...] = tuple(_GENERATION_OUTPUT_BY_NAME)
 
 
 def validate_sudoku_difficulty(
@@ -30,11 +35,12 @@ def validate_sudoku_difficulty(
     if value is None:
         return Difficulty.EASY
 
-    try:
-        return Difficulty[value.upper()]
-    except ValueError:
+    difficulty: Optional[Difficulty] = _DIFFICULTY_BY_NAME.get(value.lower())
+    if difficulty is None:
         raise click.BadParameter(f"Invalid difficulty: {value}")
 
+    return difficulty
+
 
 def validate_generation_output(
     _ctx: click.Context, _param: click.Parameter, value: Optional[str]
@@ -56,7 +62,10 @@ def validate_generation_output(
     if value is None:
         return GenerationOutput.STDOUT
 
-    try:
-        return GenerationOutput[value.upper()]
-    except ValueError:
+    generation_output: Optional[GenerationOutput] = _GENERATION_OUTPUT_BY_NAME.get(
+        value.lower()
+    )
+    if generation_output is None:
         raise click.BadParameter(f"Invalid output: {value}")
+
+    return generation_output